@@ -0,0 +1,122 @@
+import glob
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+ARROW_DIR = "arrow"
+
+
+def arrow_path(folder: str, name: str):
+    """
+    Returns the path of the Arrow IPC artifact of a table.
+
+    Parameters:
+    folder (str): Folder holding the table (e.g. 'Datas' or a work directory).
+    name (str): Name of the table (CSV file name without extension).
+
+    Returns:
+    str: Path of the artifact, in the `arrow` sub-folder of `folder`.
+    """
+    return os.path.join(folder, ARROW_DIR, f"{name}.arrow")
+
+
+def arrow_tables(folder: str):
+    """
+    Lists the Arrow IPC artifacts of a folder.
+
+    Parameters:
+    folder (str): Folder whose `arrow` sub-folder is scanned.
+
+    Returns:
+    dict: Table names as keys and artifact paths as values.
+    """
+    paths = sorted(glob.glob(os.path.join(folder, ARROW_DIR, "*.arrow")))
+    return {os.path.splitext(os.path.basename(path))[0]: path for path in paths}
+
+
+def source_metadata(csv_path: str):
+    """
+    Describes the CSV export an artifact mirrors by its exact size and modification time.
+    """
+    stat = os.stat(csv_path)
+    return {b"source_size": str(stat.st_size).encode(),
+            b"source_mtime_ns": str(stat.st_mtime_ns).encode()}
+
+
+def write_arrow(df: pd.DataFrame, path: str, source=None):
+    """
+    Writes a DataFrame once as an uncompressed Arrow IPC (Feather v2) file.
+
+    Uncompressed files can be memory-mapped by the readers without copying the column buffers.
+    The file is written next to the artifact and then renamed over it, so frames still mapping
+    the previous version keep reading the old file instead of the rewritten one.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to write.
+    path (str): Path of the artifact.
+    source (str): Optional CSV export mirrored by the artifact, recorded in the schema metadata.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if source is not None:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source_metadata(source)})
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_arrow(path: str, copy=True):
+    """
+    Opens an Arrow IPC artifact as a DataFrame.
+
+    With copy=False the DataFrame is backed by a memory map: numeric columns without missing
+    values share the mapped buffers instead of being copied, so several processes reading the
+    same artifact share the page cache. Those columns are read-only.
+
+    Parameters:
+    path (str): Path of the artifact.
+    copy (bool): Whether to load the table into writable memory.
+
+    Returns:
+    pd.DataFrame: The table stored in the artifact.
+    """
+    if copy:
+        return feather.read_table(path, memory_map=False).to_pandas()
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def is_fresh(path: str, csv_path: str):
+    """
+    Checks that an artifact exists and was written from the current content of a CSV export.
+
+    The size and modification time (in nanoseconds) recorded in the artifact must match the CSV
+    exactly, so a CSV restored with an older timestamp is never shadowed by a stale artifact.
+    """
+    if not os.path.exists(path):
+        return False
+    metadata = feather.read_table(path, memory_map=True).schema.metadata or {}
+    expected = source_metadata(csv_path)
+    return all(metadata.get(key) == value for key, value in expected.items())
+
+
+def export_csv(df: pd.DataFrame, folder: str, name: str):
+    """
+    Writes a table as its final CSV export and refreshes the Arrow IPC artifact mirroring it.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to export.
+    folder (str): Folder receiving `<name>.csv` and `arrow/<name>.arrow`.
+    name (str): Name of the table.
+    """
+    os.makedirs(folder, exist_ok=True)
+    file_path = os.path.join(folder, f"{name}.csv")
+    df.to_csv(file_path, index=False)
+    write_arrow(df, arrow_path(folder, name), source=file_path)
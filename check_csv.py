@@ -0,0 +1,230 @@
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from manage_csv import dataframe_loop_decorator, load_read_only_dataframes
+
+MERGED_NUMBER_PATTERN = r'\d+ \d+'
+FAILURE_COLUMNS = ['rule', 'row', 'column', 'value']
+
+
+def to_numeric(df: pd.DataFrame):
+    """
+    Converts every column of a DataFrame to numbers, column by column.
+
+    Thousands separators ("6,117") are removed and non-numeric cells become NaN.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+    pd.DataFrame: A numeric DataFrame with the same index and columns.
+    """
+    return df.apply(lambda col: pd.to_numeric(
+        col.astype(str).str.replace(',', '', regex=False), errors='coerce'))
+
+
+def failing_cells(df: pd.DataFrame, mask: pd.DataFrame, rule_name: str):
+    """
+    Lists the cells of a DataFrame flagged by a boolean mask.
+
+    Parameters:
+    df (pd.DataFrame): The checked DataFrame (or a subset of its columns).
+    mask (pd.DataFrame): Boolean DataFrame aligned with `df`, True on failing cells.
+    rule_name (str): Name of the rule reported for each failing cell.
+
+    Returns:
+    pd.DataFrame: One row per failing cell with the columns rule, row, column and value.
+    """
+    rows, cols = np.nonzero(mask.to_numpy())
+    return pd.DataFrame({
+        'rule': rule_name,
+        'row': df.index[rows],
+        'column': df.columns[cols],
+        'value': df.to_numpy()[rows, cols],
+    })
+
+
+def non_negative(by_name=re.compile(r'.*')):
+    """
+    Rule: values of the columns whose names match the regex are not negative.
+    """
+    def rule(df: pd.DataFrame, df_name: str):
+        subset = df.filter(regex=by_name)
+        return failing_cells(subset, to_numeric(subset) < 0, 'non_negative')
+    return rule
+
+
+def no_merged_numbers():
+    """
+    Rule: no text cell still holds two numbers separated by a space (e.g. "12 4").
+    """
+    def rule(df: pd.DataFrame, df_name: str):
+        subset = df.select_dtypes(include='object')
+        mask = subset.apply(lambda col: col.str.contains(MERGED_NUMBER_PATTERN, na=False))
+        return failing_cells(subset, mask, 'no_merged_numbers')
+    return rule
+
+
+def sum_equals(total: str, exclude=()):
+    """
+    Rule: on each row, the sum of all other columns (except `exclude`) equals the `total` column.
+    """
+    def rule(df: pd.DataFrame, df_name: str):
+        if total not in df.columns:
+            print(f"Warning: Total column '{total}' not found in the DataFrame: {df_name}")
+            return pd.DataFrame(columns=FAILURE_COLUMNS)
+        numeric = to_numeric(df.drop(columns=list(exclude), errors='ignore'))
+        parts = numeric.drop(columns=total).sum(axis=1)
+        mask = (parts != numeric[total]).to_frame(total)
+        return failing_cells(df[[total]], mask, 'sum_equals')
+    return rule
+
+
+def same_row_count(previous_dfs: dict):
+    """
+    Rule: a table has as many rows as the same table of the previous release.
+    """
+    def rule(df: pd.DataFrame, df_name: str):
+        previous = previous_dfs.get(df_name)
+        if previous is None or len(previous) == len(df):
+            return pd.DataFrame(columns=FAILURE_COLUMNS)
+        return pd.DataFrame([['same_row_count', None, None, f"{len(df)} rows, {len(previous)} previously"]],
+                            columns=FAILURE_COLUMNS)
+    return rule
+
+
+# Rules applied to every table whose name matches the regex
+RULES = {
+    r'.*': [no_merged_numbers()],
+    r'.*8.*': [non_negative(r'^LC endemics')],
+    r'.*2.*': [non_negative(r'.*'), sum_equals('TOTAL', exclude=('Year', 'Status'))],
+}
+
+
+# Failing cells reviewed and accepted, as (table, rule, row, column, value).
+# They come from the PDF extraction of the 2024-2 release, not from the cleaning code:
+# - Table 8a (Caribbean) and Table 8c (Dragonflies & Damselflies): the extracted
+#   "Total endemics" is lower than threatened + EX & EW endemics.
+# - Table 1b: garbled "Red List version" cells.
+# An entry only hides a failure with the same value, so any change is reported again.
+KNOWN_FAILURES = [
+    ('Table_8a_1', 'non_negative', 184, 'LC endemics (Birds)', -1.0),
+    ('Table_8a_1', 'non_negative', 184, 'LC endemics (Mammals)', -5.0),
+    ('Table_8a_1', 'non_negative', 187, 'LC endemics (Mammals)', -1.0),
+    ('Table_8a_1', 'non_negative', 189, 'LC endemics (Birds)', -2.0),
+    ('Table_8a_1', 'non_negative', 191, 'LC endemics (Mammals)', -2.0),
+    ('Table_8c_merged', 'non_negative', 9, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 13, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 19, 'LC endemics (Dragonflies & Damselflies)', -6.0),
+    ('Table_8c_merged', 'non_negative', 22, 'LC endemics (Dragonflies & Damselflies)', -2.0),
+    ('Table_8c_merged', 'non_negative', 25, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 30, 'LC endemics (Dragonflies & Damselflies)', -8.0),
+    ('Table_8c_merged', 'non_negative', 38, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 39, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 40, 'LC endemics (Dragonflies & Damselflies)', -2.0),
+    ('Table_8c_merged', 'non_negative', 43, 'LC endemics (Dragonflies & Damselflies)', -3.0),
+    ('Table_8c_merged', 'non_negative', 44, 'LC endemics (Dragonflies & Damselflies)', -1.0),
+    ('Table_8c_merged', 'non_negative', 57, 'LC endemics (Dragonflies & Damselflies)', -6.0),
+    ('Table_1b_Changes_in_numbers_of_species', 'no_merged_numbers', 34, 'Unnamed: 0', '2024\n(versi2on0 027024-2)'),
+    ('Table_1b_Changes_in_numbers_of_species', 'no_merged_numbers', 36, 'Unnamed: 0', '2024\n(versi2on0 026024-2)'),
+]
+
+
+def failure_key(table, rule, row, column, value):
+    """
+    Identifies a failing cell, comparing numeric values as numbers (-1 and -1.0 are the same value).
+    """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = str(value)
+    return (table, rule, row, column, value)
+
+
+def drop_known_failures(failures: pd.DataFrame, known_failures=KNOWN_FAILURES):
+    """
+    Removes the reviewed failures from a report.
+
+    Parameters:
+    failures (pd.DataFrame): Failing cells with the columns table, rule, row, column and value.
+    known_failures (list): Accepted failures as (table, rule, row, column, value) tuples.
+
+    Returns:
+    pd.DataFrame: The failing cells that are not in the allow-list.
+    """
+    known = {failure_key(*failure) for failure in known_failures}
+    mask = [failure_key(*failure) not in known for failure in failures.itertuples(index=False)]
+    return failures.loc[mask].reset_index(drop=True)
+
+
+@dataframe_loop_decorator
+def check_table(df: pd.DataFrame, df_name: str, rules: dict):
+    """
+    Runs the rules whose regex matches the DataFrame's name.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to check.
+    df_name (str): The name of the DataFrame.
+    rules (dict): Regex patterns as keys and lists of rules as values.
+
+    Returns:
+    pd.DataFrame: The failing cells, or None if every rule passes.
+    """
+    failures = [rule(df, df_name)
+                for pattern, table_rules in rules.items() if re.match(pattern, df_name)
+                for rule in table_rules]
+    failures = [f for f in failures if not f.empty]
+    if failures:
+        return pd.concat(failures, ignore_index=True)
+
+
+def check_frames(dfs: dict, previous_dfs=None, rules=RULES, known_failures=KNOWN_FAILURES):
+    """
+    Checks in-memory tables against the consistency rules.
+
+    Parameters:
+    dfs (dict): A dictionary of DataFrames, where the keys are the names of the DataFrames.
+    previous_dfs (dict): Optional tables of the previous release, used to compare row counts.
+    rules (dict): Regex patterns as keys and lists of rules as values.
+    known_failures (list): Accepted failures as (table, rule, row, column, value) tuples.
+
+    Returns:
+    pd.DataFrame: One row per failing cell with the columns table, rule, row, column and value.
+    """
+    if previous_dfs is not None:
+        rules = {**rules, r'.*': [*rules.get(r'.*', []), same_row_count(previous_dfs)]}
+
+    failures = check_table(dfs, rules=rules)
+    if not failures:
+        return pd.DataFrame(columns=['table', *FAILURE_COLUMNS])
+    failures = pd.concat(failures, names=['table', None]).reset_index(level=0).reset_index(drop=True)
+    return drop_known_failures(failures, known_failures)
+
+
+def check_tables(folder: str, previous_folder=None, rules=RULES, known_failures=KNOWN_FAILURES):
+    """
+    Checks all the cleaned tables of a folder against the consistency rules.
+
+    Parameters:
+    folder (str): Path to the folder containing the CSV files to check.
+    previous_folder (str): Optional folder of the previous release, used to compare row counts.
+    rules (dict): Regex patterns as keys and lists of rules as values.
+    known_failures (list): Accepted failures as (table, rule, row, column, value) tuples.
+
+    Returns:
+    pd.DataFrame: One row per failing cell with the columns table, rule, row, column and value.
+    """
+    dfs = load_read_only_dataframes(folder)
+    previous_dfs = load_read_only_dataframes(previous_folder) if previous_folder is not None else None
+    return check_frames(dfs, previous_dfs, rules=rules, known_failures=known_failures)
+
+
+if __name__ == "__main__":
+    failures = check_tables("Datas")
+    if not failures.empty:
+        print(failures.to_string(index=False))
+        sys.exit(1)
+    print("Toutes les vérifications sont passées.")
@@ -1,117 +1,100 @@
-import csv
-import glob
 import os
 import re
-import shutil
 
 import pandas as pd
 
+from arrow_store import arrow_tables, export_csv, read_arrow
 
-def extract_relevant_tables(*args):
+
+def extract_relevant_tables(*args, tables):
     """
-    Extracts relevant CSV filenames that match specific table numbers.
+    Extracts relevant table names that match specific table numbers.
 
     Args:
-        *args: Table numbers to match in filenames.
+        *args: Table numbers to match in table names.
+        tables (dict): Tables being cleaned, keyed by name.
 
     Returns:
-        list: List of matching CSV filenames.
+        list: List of matching table names.
     """
     pattern = re.compile(r'Table_(' + '|'.join(map(re.escape, args)) +
                          r')(?:_|$)')  # Regex to match desired table numbers
-    relevant_files = []
-
-    for filename in os.listdir('.'):
-        if filename.endswith('.csv') and pattern.search(filename):
-            relevant_files.append(filename)
+    relevant_tables = [name for name in tables if pattern.search(name)]
 
-    print("Matching files:", relevant_files)
-    return relevant_files
+    print("Matching tables:", relevant_tables)
+    return relevant_tables
 
 
-def suppress_heading_rows(file_path, output_path):
-    """
-    Removes unnecessary heading rows from a CSV file and saves the cleaned version.
-
-    Args:
-        file_path (str): Path to the input CSV file.
-        output_path (str): Path to save the cleaned CSV file.
+def suppress_heading_rows(df):
     """
-    with open(file_path, 'r') as file:
-        reader = csv.reader(file)
-        rows = list(reader)
+    Removes unnecessary heading rows from a raw table.
 
-    while rows:
-        first_row = rows[0]  # Check the first row
-        non_empty_cells = [cell.strip() for cell in first_row if cell.strip()]
+    A leading row is suppressible when it is empty or when only its first cell is filled.
 
-        if (not non_empty_cells) or (len(non_empty_cells) == 1 and first_row[0].strip()):
-            rows.pop(0)  # Remove the row
-        else:
-            break  # Stop if the row is not suppressible
+    Args:
+        df (pd.DataFrame): Raw table, header row included as data.
 
-    with open(output_path, 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerows(rows)
+    Returns:
+        pd.DataFrame: The table without its leading suppressible rows.
+    """
+    filled = df.notna() & (df.astype(str).apply(lambda col: col.str.strip()) != '')
+    non_empty_cells = filled.sum(axis=1)
+    suppressible = (non_empty_cells == 0) | ((non_empty_cells == 1) & filled.iloc[:, 0])
+    # Stop at the first row that is not suppressible
+    leading = suppressible.astype(int).cummin().astype(bool)
+    return df[~leading].reset_index(drop=True)
 
 
-def transform_table(file_path, output_path):
+def transform_table(df):
     """
-    Transforms a CSV table by removing duplicate rows and empty rows.
+    Transforms a raw table by removing duplicate rows and empty rows.
 
     Args:
-        file_path (str): Path to the input CSV file.
-        output_path (str): Path to save the transformed CSV file.
+        df (pd.DataFrame): Raw table, header row included as data.
+
+    Returns:
+        pd.DataFrame: The transformed table.
     """
-    df = pd.read_csv(file_path, header=None)  # Treats all rows as plain data
     df = df.drop_duplicates()
     df = df.dropna(how='all')  # Drops rows where all cells are NaN or empty
-    # Exclude header in output
-    df.to_csv(output_path, index=False, header=False)
-    print(
-        f"Data transformed, duplicates and empty rows removed, and saved to '{output_path}'.")
+    return df.reset_index(drop=True)
 
 
-def natural_sort_key(filename):
-    # Extract only the last number before .csv
-    match = re.match(r'.*_(\d+)\.csv$', filename)
+def natural_sort_key(name):
+    # Extract only the last number of the table name
+    match = re.match(r'.*_(\d+)$', name)
     # Default to 1 if no number is found
     num_part = int(match.group(1)) if match else 1
     return num_part
 
 
-def group_tables_by_identifier(files):
+def group_tables_by_identifier(names):
     grouped_files = {}
-    for file in files:
-        match = re.match(r'Table_(\d+[a-z]?)', file)
+    for name in names:
+        match = re.match(r'Table_(\d+[a-z]?)', name)
         if match:
             key = match.group(1)
-            grouped_files.setdefault(key, []).append(file)
+            grouped_files.setdefault(key, []).append(name)
 
-    # Sort each group by the last number before .csv
+    # Sort each group by the last number of the table name
     for key in grouped_files:
         grouped_files[key] = sorted(grouped_files[key], key=natural_sort_key)
 
     return grouped_files
 
 
-def merge_grouped_tables(grouped_files):
-    for key, files in grouped_files.items():
-        dataframes = [pd.read_csv(f, header=None) for f in files]
+def merge_grouped_tables(grouped_files, tables):
+    for key, names in grouped_files.items():
+        # The original tables are replaced by the merged one
+        dataframes = [tables.pop(name) for name in names]
         max_cols = max(df.shape[1] for df in dataframes)
-        dataframes = [df.reindex(columns=range(max_cols)) for df in dataframes]
-
-        # Delete the original CSV files
-        for f in files:
-            os.remove(f)
-            print(f"Deleted file: {f}")
+        columns = [str(i) for i in range(max_cols)]
+        dataframes = [df.reindex(columns=columns) for df in dataframes]
 
-        combined_df = pd.concat(dataframes, ignore_index=True)
-        combined_output = f"Table_{key}_merged.csv"
-        combined_df.to_csv(combined_output, index=False,
-                           header=False)  # Remove Unnamed columns
+        combined_name = f"Table_{key}_merged"
+        tables[combined_name] = pd.concat(dataframes, ignore_index=True)
         print(
-            f"CSV files {files} have been combined and saved as '{combined_output}'.")
+            f"Tables {names} have been combined into '{combined_name}'.")
 
 
 def print_grouped_tables(grouped_files):
@@ -119,14 +102,34 @@ def print_grouped_tables(grouped_files):
         print(f"Group {key}: {files}")
 
 
-def merge_two_line_header(input_file):
-    """Lit un CSV, fusionne les deux premières lignes en tant qu'en-tête, et enregistre le résultat."""
-    df = pd.read_csv(input_file, header=None)
+def unique_columns(columns):
+    """Nomme les colonnes comme pd.read_csv : "Unnamed: i" pour les vides, suffixe ".n" pour les doublons."""
+    names = []
+    seen = {}
+    for i, col in enumerate(columns):
+        name = col if isinstance(col, str) and col else f"Unnamed: {i}"
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(f"{name}.{count}" if count else name)
+    return names
+
+
+def promote_header(df):
+    """Utilise la première ligne d'un tableau brut comme en-tête."""
+    if df.empty:
+        return df
+    header = df.iloc[0].tolist()
+    df = df.iloc[1:].reset_index(drop=True)
+    df.columns = unique_columns(header)
+    return df
+
 
+def merge_two_line_header(df, name):
+    """Fusionne les deux premières lignes d'un tableau brut en tant qu'en-tête."""
     if len(df) < 2:
         print(
-            f"Le fichier {input_file} a moins de 2 lignes, il ne sera pas traité.")
-        return
+            f"Le tableau {name} a moins de 2 lignes, il ne sera pas traité.")
+        return None
 
     # Extraction des deux premières lignes
     header_row1 = df.iloc[0]  # Première ligne
@@ -146,39 +149,36 @@ def merge_two_line_header(input_file):
 
     # Mise à jour du DataFrame : suppression des deux premières lignes et affectation du nouvel en-tête
     df = df.iloc[2:].reset_index(drop=True)
-    df.columns = merged_header
-
-    # Sauvegarde du fichier modifié
-    df.to_csv(input_file, index=False)
-    print(f"Header fusionné et sauvegardé sous '{input_file}'.")
+    df.columns = unique_columns(merged_header)
+    print(f"Header fusionné pour '{name}'.")
+    return df
 
 
-def tables_with_2_lines_header(*args):
-    """Recherche les fichiers CSV correspondant au modèle donné et respectant la règle du dernier caractère."""
+def tables_with_2_lines_header(*args, tables):
+    """Recherche les tableaux correspondant au modèle donné et respectant la règle du dernier caractère."""
     pattern = re.compile(
         r'Table_(' + '|'.join(map(re.escape, args)) + r')(?:_|$)')  # Modèle regex
-    relevant_files = []
+    relevant_tables = []
 
-    # Liste des fichiers .csv respectant le critère du dernier caractère
-    for filename in os.listdir('.'):
-        if filename.endswith('.csv') and pattern.search(filename):
-            last_char = filename[-5]  # Le dernier caractère avant '.csv'
+    # Liste des tableaux respectant le critère du dernier caractère
+    for name in tables:
+        if pattern.search(name):
+            last_char = name[-1]  # Le dernier caractère du nom
             if last_char.isalpha() or last_char == '1':
-                relevant_files.append(filename)
+                relevant_tables.append(name)
 
-    print("Fichiers correspondants:", relevant_files)
-    return relevant_files
+    print("Tableaux correspondants:", relevant_tables)
+    return relevant_tables
 
 
-def add_regions(input_file: str):
+def add_regions(df: pd.DataFrame):
     """
-    Traite un fichier CSV en ajoutant une colonne 'Region' et en supprimant les lignes
+    Ajoute une colonne 'Region' à un tableau et supprime les lignes
     où seule la première colonne est remplie.
 
-    :param input_file: Chemin du fichier CSV d'entrée
-    :param output_file: Chemin du fichier CSV de sortie
+    :param df: Tableau dont la première ligne d'en-tête a déjà été promue
+    :return: Le tableau avec la colonne 'Region'
     """
-    df = pd.read_csv(input_file)
     mask = df.iloc[:, 1:].isna().all(axis=1) & df.iloc[:, 0].notna()
     indices_to_remove = df.index[mask]
 
@@ -189,7 +189,6 @@ def add_regions(input_file: str):
     df = df.reset_index(drop=True)
 
     df.rename(columns={df.columns[0]: "Country"}, inplace=True)
-    df.to_csv(input_file, index=False)
     return df
 
 
@@ -208,13 +207,13 @@ def split_merged_numbers(cell: str) -> tuple:
     return parts[0], parts[1] if len(parts) > 1 else ""
 
 
-def process_csv(input_file: str):
+def process_csv(df: pd.DataFrame):
     """
-    Lit un fichier CSV, détecte les cellules fusionnées et ajuste les colonnes.
+    Détecte les cellules fusionnées d'un tableau et ajuste les colonnes.
     """
-    with open(input_file, newline='', encoding='utf-8') as infile:
-        reader = csv.reader(infile)
-        rows = [row for row in reader]
+    if df.empty:
+        return df
+    rows = df.astype(object).where(df.notna(), '').astype(str).values.tolist()
 
     processed_rows = []
     for row in rows:
@@ -233,60 +232,89 @@ def process_csv(input_file: str):
             i += 1
         processed_rows.append(new_row)
 
-    with open(input_file, 'w', newline='', encoding='utf-8') as outfile:
-        writer = csv.writer(outfile)
-        writer.writerows(processed_rows)
+    processed = pd.DataFrame(processed_rows, index=df.index)
+    extra_columns = [""] * (processed.shape[1] - df.shape[1])
+    processed.columns = unique_columns(list(df.columns) + extra_columns)
+    return processed.where(processed != '')
 
 
-if __name__ == "__main__":
-    # Process files for suppressing heading rows
-    for file in extract_relevant_tables('7', '8b', '8c', '1b'):
-        output_file = f"{file}"
-        suppress_heading_rows(file, output_file)
-        print(f"Heading rows suppressed and saved to '{output_file}'.")
-
-    # Process files for transformation
-    for file in extract_relevant_tables('1b', '8a', '8b', '8c', '8d'):
-        output_file = f"{file}"
-        transform_table(file, output_file)
-        print(f"Processed and saved: {output_file}")
+def infer_types(df: pd.DataFrame):
+    """Convertit en nombres les colonnes entièrement numériques, comme le ferait pd.read_csv."""
+    def convert(col):
+        try:
+            return pd.to_numeric(col)
+        except (ValueError, TypeError):
+            return col
+    return df.apply(convert)
+
+
+def clean_tables(work_dir='.', datas_dir='./Datas'):
+    """
+    Runs the whole cleaning stage on the raw tables of `work_dir` and exports
+    the results into `datas_dir`. Each run only touches its own directories,
+    so several releases can be cleaned side by side.
+
+    The raw tables are opened from the Arrow IPC files written by pdf_table_reader
+    and every transform works on the in-memory DataFrames. CSV is only written
+    once, as the final export, next to an Arrow IPC copy read by manage_csv.
+
+    Args:
+        work_dir (str): Directory holding the `arrow` folder written by pdf_table_reader.
+        datas_dir (str): Directory receiving the cleaned CSV files.
+    """
+    if os.path.abspath(work_dir) == os.path.abspath(datas_dir):
+        raise ValueError("work_dir and datas_dir must be different directories.")
+
+    tables = {name: read_arrow(path, copy=False) for name, path in arrow_tables(work_dir).items()}
+
+    # Process tables for suppressing heading rows
+    for name in extract_relevant_tables('7', '8b', '8c', '1b', tables=tables):
+        tables[name] = suppress_heading_rows(tables[name])
+        print(f"Heading rows suppressed in '{name}'.")
+
+    # Process tables for transformation
+    for name in extract_relevant_tables('1b', '8a', '8b', '8c', '8d', tables=tables):
+        tables[name] = transform_table(tables[name])
+        print(f"Processed: {name}")
 
     # Run the grouping and merging process
-    files_to_merge = extract_relevant_tables('7', '8b', '8c')
-    grouped_files = group_tables_by_identifier(files_to_merge)
+    tables_to_merge = extract_relevant_tables('7', '8b', '8c', tables=tables)
+    grouped_files = group_tables_by_identifier(tables_to_merge)
     print_grouped_tables(grouped_files)
-    merge_grouped_tables(grouped_files)
+    merge_grouped_tables(grouped_files, tables)
+
+    # Process tables for transformation
+    for name in extract_relevant_tables('7', '8b', '8c', tables=tables):
+        tables[name] = transform_table(tables[name])
+        print(f"Processed: {name}")
 
-    # Process files for transformation
-    for file in extract_relevant_tables('7', '8b', '8c'):
-        output_file = f"{file}"
-        transform_table(file, output_file)
-        print(f"Processed and saved: {output_file}")
+    headed = set()
+    for name in tables_with_2_lines_header('1b', '8a', '8b', '8c', '8d', tables=tables):
+        merged = merge_two_line_header(tables[name], name)
+        if merged is not None:
+            tables[name] = merged
+            headed.add(name)
 
-    tables = tables_with_2_lines_header('1b', '8a', '8b', '8c', '8d')
-    for table in tables:
-        merge_two_line_header(table)
+    # Les autres tableaux gardent leur première ligne comme en-tête
+    for name in tables:
+        if name not in headed:
+            tables[name] = promote_header(tables[name])
 
-    dataframes = extract_relevant_tables('8a', '8b', '8c')
-    for df in dataframes:
-        add_regions(df)
+    for name in extract_relevant_tables('8a', '8b', '8c', tables=tables):
+        tables[name] = add_regions(tables[name])
 
-    dataframes = extract_relevant_tables('8c')
-    for df in dataframes:
-        process_csv(df)
-    print("Le fichier corrigé a été enregistré")
+    for name in extract_relevant_tables('8c', tables=tables):
+        tables[name] = process_csv(tables[name])
+    print("Les cellules fusionnées ont été corrigées")
 
     ####################################################
 
-    datas_dir = "./Datas"
-    os.makedirs(datas_dir, exist_ok=True)
-    # Recherche de tous les fichiers .csv dans le dossier courant
-    csv_files = glob.glob("*.csv")
-    for csv_file in csv_files:
-        try:
-            shutil.move(csv_file, os.path.join(datas_dir, csv_file))
-            print(f"Déplacé : {csv_file} -> {datas_dir}/")
-        except Exception as e:
-            print(f"Erreur lors du déplacement de {csv_file} : {e}")
+    for name, df in tables.items():
+        export_csv(infer_types(df), datas_dir, name)
+        print(f"Exporté : {name} -> {datas_dir}/")
+
+    print("Tous les tableaux ont été exportés.")
 
-    print("Tous les fichiers CSV ont été déplacés.")
+
+if __name__ == "__main__":
+    clean_tables()
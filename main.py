@@ -1,12 +1,64 @@
-
+import os
+import shutil
 import subprocess
+import sys
+import tempfile
+from functools import partial
+
+from arrow_store import ARROW_DIR, arrow_path, arrow_tables
+from check_csv import check_frames
+from csv_cleaner import clean_tables
+from manage_csv import load_read_only_dataframes, refresh_tables
+from pdf_table_reader import process_directory
+
+
+def publish_tables(staging_dir, datas_dir):
+    """
+    Déplace les CSV validés de staging_dir, et leurs fichiers Arrow IPC, vers datas_dir.
+    """
+    os.makedirs(os.path.join(datas_dir, ARROW_DIR), exist_ok=True)
+    for file_name in os.listdir(staging_dir):
+        if file_name.endswith('.csv'):
+            shutil.move(os.path.join(staging_dir, file_name), os.path.join(datas_dir, file_name))
+    for name, path in arrow_tables(staging_dir).items():
+        shutil.move(path, arrow_path(datas_dir, name))
+
+
+def run_pipeline(pdf_dir, work_dir, datas_dir, previous_datas_dir=None):
+    """
+    Extrait, nettoie et transforme les tableaux d'une release dans un espace de travail isolé.
+
+    Chaque étape lit et écrit uniquement dans les répertoires donnés, ce qui permet
+    de lancer plusieurs releases en parallèle sur la même machine. Les tableaux sont
+    préparés dans work_dir/staging et ne sont publiés dans datas_dir que si toutes les
+    vérifications de check_csv passent ; sinon une ValueError est levée et datas_dir
+    n'est pas modifié.
+
+    Parameters:
+    pdf_dir (str): Répertoire contenant les PDF de la release.
+    work_dir (str): Répertoire de travail pour les tableaux intermédiaires.
+    datas_dir (str): Répertoire de sortie des CSV finaux.
+    previous_datas_dir (str): CSV finaux de la release précédente, pour comparer le nombre de lignes.
+    """
+    staging_dir = os.path.join(work_dir, "staging")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(work_dir, exist_ok=True)
+
+    process_directory(pdf_dir, output_dir=work_dir)
+    clean_tables(work_dir=work_dir, datas_dir=staging_dir)
+
+    previous_dfs = None
+    if previous_datas_dir is not None:
+        previous_dfs = load_read_only_dataframes(previous_datas_dir)
+    dfs = refresh_tables(staging_dir, check=partial(check_frames, previous_dfs=previous_dfs))
+
+    publish_tables(staging_dir, datas_dir)
+    return dfs
+
 
 if __name__ == '__main__':
     scripts = ["scrap_pdf.py",
-               "IUCN_data_scrap.py",
-               "pdf_table_reader.py",
-               "csv_cleaner.py",
-               "manage_csv.py"]
+               "IUCN_data_scrap.py"]
 
     for script in scripts:
         try:
@@ -15,4 +67,13 @@ if __name__ == '__main__':
             print(f"{script} terminé avec succès.\n")
         except subprocess.CalledProcessError as e:
             print(f"Erreur lors de l'exécution de {script} : {e}")
-            break
+            sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        try:
+            print("Extraction, nettoyage et vérification des tableaux...")
+            run_pipeline("iucn_pdfs", work_dir, "Datas")
+        except ValueError as e:
+            print(f"Erreur lors du pipeline : {e}")
+            sys.exit(1)
+    print("Pipeline terminé avec succès.")
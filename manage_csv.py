@@ -2,12 +2,18 @@ import os
 import re
 import pandas as pd
 
-def load_csv_dataframes(folder_path:str):
+from arrow_store import arrow_path, export_csv, is_fresh, read_arrow
+
+def load_csv_dataframes(folder_path:str, copy=True):
     """
     Load all CSV files from the specified folder into DataFrames.
 
+    A table is opened from its Arrow IPC artifact when it was written from the current CSV,
+    and parsed from CSV otherwise.
+
     Parameters:
     folder_path (str): Path to the folder containing the CSV files.
+    copy (bool): Whether tables opened from an artifact are loaded into writable memory.
 
     Returns:
     dict: A dictionary with file names (without extensions) as keys and DataFrames as values.
@@ -17,15 +23,34 @@ def load_csv_dataframes(folder_path:str):
     for file_name in os.listdir(folder_path):
         if file_name.endswith('.csv'):
             file_path = os.path.join(folder_path, file_name)
+            base_name = os.path.splitext(file_name)[0]
+            artifact = arrow_path(folder_path, base_name)
             try:
-                df = pd.read_csv(file_path)
-                base_name = os.path.splitext(file_name)[0]
+                if is_fresh(artifact, file_path):
+                    df = read_arrow(artifact, copy=copy)
+                else:
+                    df = pd.read_csv(file_path)
                 dataframes[base_name] = df
             except Exception as e:
                 print(f"Error loading {file_name}: {e}")
 
     return dataframes
 
+def load_read_only_dataframes(folder_path:str):
+    """
+    Load all CSV files from the specified folder without copying the Arrow IPC artifacts.
+
+    Tables with an up-to-date artifact share its memory map and their numeric columns are read-only,
+    so the returned DataFrames must not be modified.
+
+    Parameters:
+    folder_path (str): Path to the folder containing the CSV files.
+
+    Returns:
+    dict: A dictionary with file names (without extensions) as keys and DataFrames as values.
+    """
+    return load_csv_dataframes(folder_path, copy=False)
+
 def dataframe_loop_decorator(func):
     """
     Decorator to automatically loop through a dictionary of DataFrames and apply a function.
@@ -161,32 +186,59 @@ def concat_all_dataframes(dfs: dict):
 
 @dataframe_loop_decorator
 def actualize_csv(df:pd.DataFrame, df_name, folder='Datas'):
-    file_path = os.path.join(folder, f"{df_name}.csv")
-    df.to_csv(file_path, index=False)
+    export_csv(df, folder, df_name)
     return df
 
-if __name__ == "__main__":
+def refresh_tables(folder='Datas', check=None):
+    """
+    Applies the final transformations to the cleaned tables of a folder and writes them back.
+
+    The tables exported by csv_cleaner are opened zero-copy from their Arrow IPC artifacts.
+    When `check` is given, it runs on the transformed DataFrames before anything is written,
+    and nothing is written if it reports failing cells.
+
+    Parameters:
+    folder (str): Path to the folder containing the cleaned CSV files.
+    check (callable): Optional function taking the dictionary of DataFrames and returning
+    a DataFrame of failing cells (see check_csv.check_frames).
 
+    Returns:
+    dict: A dictionary with file names (without extensions) as keys and DataFrames as values.
+    Their original numeric columns may share a memory map and be read-only.
+    """
     # load all dataframes
-    folder = "Datas"
-    dfs = load_csv_dataframes(folder)
+    dfs = load_read_only_dataframes(folder)
 
     # add LC col into all tables "8"
     dfs_8 = select_table(dfs, by_name=re.compile(r'.*8.*'))
     dfs_8 = rename_columns(dfs=dfs_8)
     animals_classes = select_column(dfs=dfs_8)
     dfs_8 = add_lc_endemics_column(dfs=dfs_8, classe_dict=animals_classes)
-    actualize_csv(dfs=dfs_8)
 
     # merge all tables "2" and create new column Status = (CR, EN, VU)
     dfs_2 = select_table(dfs, by_name=re.compile(r'.*2.*'))
     dfs_2 = rename_columns(dfs=dfs_2)
     dfs_2 = add_status(dfs_2)
-    actualize_csv(dfs=dfs_2)
     Table_time = concat_all_dataframes(dfs_2)
-    Table_time.to_csv('Datas/Table_time.csv')
 
     # rename columns for all tables "7"
     dfs_7 = select_table(dfs, by_name=re.compile(r'.*7.*'))
     dfs_7 = rename_columns(dfs=dfs_7)
-    actualize_csv(dfs=dfs_7)
+
+    # check the transformed tables before exporting them
+    if check is not None:
+        failures = check({**dfs, 'Table_time': Table_time})
+        if not failures.empty:
+            raise ValueError(f"Checks failed in {folder}, nothing was written:\n{failures.to_string(index=False)}")
+
+    actualize_csv(dfs=dfs_8, folder=folder)
+    actualize_csv(dfs=dfs_2, folder=folder)
+    Table_time.to_csv(os.path.join(folder, 'Table_time.csv'))
+    actualize_csv(dfs=dfs_7, folder=folder)
+
+    return dfs
+
+if __name__ == "__main__":
+    from check_csv import check_frames
+
+    refresh_tables("Datas", check=check_frames)
@@ -2,14 +2,28 @@ import pdfplumber
 import pandas as pd
 import os
 
+from arrow_store import arrow_path, write_arrow
+
 def is_additional_header(row):
     """Vérifie si la première ligne est un en-tête supplémentaire."""
     non_empty_cells = sum(1 for cell in row if cell and cell.strip())
     return non_empty_cells <= 3
 
-def process_pdf(pdf_file):
-    """Extrait les tableaux d'un fichier PDF et les sauvegarde au format CSV."""
-    pdf_name_cleaned = '_'.join(pdf_file.split("_")[3:]).split(".")[0]
+def to_raw_frame(df):
+    """
+    Place l'en-tête en première ligne et nomme les colonnes par position ("0", "1", ...).
+
+    C'est la forme sous laquelle csv_cleaner lit les tableaux bruts (équivalent de header=None),
+    les cellules vides devenant des valeurs manquantes.
+    """
+    rows = [list(df.columns)] + df.values.tolist()
+    raw = pd.DataFrame(rows, columns=[str(i) for i in range(df.shape[1])])
+    return raw.where(raw != '')
+
+def process_pdf(pdf_file, output_dir="."):
+    """Extrait les tableaux d'un fichier PDF et les sauvegarde en fichiers Arrow IPC dans output_dir/arrow."""
+    # "2024-2_RL_Table_1a.pdf" -> "Table_1a", indépendamment du répertoire source
+    pdf_name_cleaned = '_'.join(os.path.basename(pdf_file).split("_")[2:]).split(".")[0]
 
     # Liste pour stocker les DataFrames de chaque tableau avec leur en-tête
     dataframes = []
@@ -59,24 +73,26 @@ def process_pdf(pdf_file):
     # Filtrer les DataFrames ayant moins de 3 lignes
     dataframes = [(df, header) for df, header in dataframes if len(df) >= 3]
 
-    # Sauvegarder les DataFrames extraits en fichiers CSV
+    # Sauvegarder les DataFrames extraits une seule fois, en fichiers Arrow IPC
     if dataframes:
         for idx, (df, header) in enumerate(dataframes, start=1):
             if header:
                 header = '_'.join(header[0].replace(' ', '_').split('_')[:5])
-                csv_filename = f"{pdf_name_cleaned}_{header}.csv"
+                table_name = f"{pdf_name_cleaned}_{header}"
             else:
-                csv_filename = f"{pdf_name_cleaned}_{idx}.csv"
-            df.to_csv(csv_filename, index=False)
-            print(f"Tableau {idx} sauvegardé dans : {csv_filename}")
+                table_name = f"{pdf_name_cleaned}_{idx}"
+            table_path = arrow_path(output_dir, table_name)
+            write_arrow(to_raw_frame(df), table_path)
+            print(f"Tableau {idx} sauvegardé dans : {table_path}")
     else:
         print(f"Aucun tableau valide trouvé dans {pdf_file}.")
 
-def process_directory(directory):
-    """Traite tous les fichiers PDF dans un répertoire donné."""
+def process_directory(directory, output_dir="."):
+    """Traite tous les fichiers PDF d'un répertoire et écrit les tableaux dans output_dir/arrow."""
+    os.makedirs(output_dir, exist_ok=True)
     for file in os.listdir(directory):
         if file.endswith(".pdf"):
-            process_pdf(os.path.join(directory, file))
+            process_pdf(os.path.join(directory, file), output_dir)
 
 # Exemple d'utilisation
 if __name__ == "__main__":
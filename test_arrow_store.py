@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+
+from arrow_store import arrow_path, export_csv, is_fresh, read_arrow, write_arrow
+
+
+def test_read_arrow_copy_is_writable(tmp_path):
+    path = str(tmp_path / "Table_test.arrow")
+    write_arrow(pd.DataFrame({'Birds': [1.0, 5.0]}), path)
+
+    df = read_arrow(path)
+    df.loc[0, 'Birds'] = 0.0
+
+    assert df['Birds'].tolist() == [0.0, 5.0]
+
+
+def test_rewrite_keeps_mapped_frame_intact(tmp_path):
+    path = str(tmp_path / "Table_test.arrow")
+    write_arrow(pd.DataFrame({'Birds': [1.0, 5.0], 'Fishes': [2.0, 3.0]}), path)
+    mapped = read_arrow(path, copy=False)
+
+    write_arrow(pd.DataFrame({'Fishes': [9.0]}), path)
+
+    assert mapped['Birds'].tolist() == [1.0, 5.0]
+    assert read_arrow(path)['Fishes'].tolist() == [9.0]
+
+
+def test_is_fresh_requires_exact_source(tmp_path):
+    folder = str(tmp_path)
+    export_csv(pd.DataFrame({'Birds': [1, 2, 3]}), folder, 'Table_test')
+    csv_path = os.path.join(folder, 'Table_test.csv')
+    artifact = arrow_path(folder, 'Table_test')
+    assert is_fresh(artifact, csv_path)
+
+    # CSV restored with an older timestamp (cp -p, rsync -a, tar)
+    stat = os.stat(csv_path)
+    pd.DataFrame({'Birds': [9]}).to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    assert not is_fresh(artifact, csv_path)
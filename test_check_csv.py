@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+import pytest
+
+from check_csv import KNOWN_FAILURES, check_frames, check_tables, no_merged_numbers, non_negative, sum_equals
+from manage_csv import refresh_tables
+
+RULES = {
+    r'.*': [non_negative(r'^(Birds|Fishes|TOTAL)$'),
+            sum_equals('TOTAL', exclude=('Year', 'Country')),
+            no_merged_numbers()],
+}
+
+
+def write_table(folder, name, df):
+    df.to_csv(folder / f"{name}.csv", index=False)
+
+
+def test_check_tables_reports_failing_cells(tmp_path):
+    write_table(tmp_path, 'Table_test', pd.DataFrame({
+        'Year': [2024, 2023],
+        'Country': ['12 4', 'Cuba'],
+        'Birds': [3, -1],
+        'Fishes': [2, 4],
+        'TOTAL': [5, 4],
+    }))
+
+    failures = check_tables(str(tmp_path), rules=RULES)
+
+    assert failures.columns.tolist() == ['table', 'rule', 'row', 'column', 'value']
+    assert failures.values.tolist() == [
+        ['Table_test', 'non_negative', 1, 'Birds', -1],
+        ['Table_test', 'sum_equals', 1, 'TOTAL', 4],
+        ['Table_test', 'no_merged_numbers', 0, 'Country', '12 4'],
+    ]
+
+
+def test_check_tables_compares_row_counts(tmp_path):
+    current, previous = tmp_path / 'current', tmp_path / 'previous'
+    current.mkdir()
+    previous.mkdir()
+    write_table(current, 'Table_test', pd.DataFrame({'Birds': [1, 2]}))
+    write_table(previous, 'Table_test', pd.DataFrame({'Birds': [1, 2, 3]}))
+
+    failures = check_tables(str(current), previous_folder=str(previous), rules={})
+
+    assert failures.values.tolist() == [
+        ['Table_test', 'same_row_count', None, None, '2 rows, 3 previously'],
+    ]
+
+
+def test_check_tables_without_failures(tmp_path):
+    write_table(tmp_path, 'Table_test', pd.DataFrame({'Birds': [1], 'Fishes': [2], 'TOTAL': [3]}))
+
+    assert check_tables(str(tmp_path), rules=RULES).empty
+
+
+def test_known_failures_hide_only_matching_values(tmp_path):
+    write_table(tmp_path, 'Table_test', pd.DataFrame({'Birds': [3, -1], 'Fishes': [2, 4], 'TOTAL': [5, 3]}))
+
+    accepted = check_tables(str(tmp_path), rules=RULES,
+                            known_failures=[('Table_test', 'non_negative', 1, 'Birds', -1.0)])
+    changed = check_tables(str(tmp_path), rules=RULES,
+                           known_failures=[('Table_test', 'non_negative', 1, 'Birds', -2.0)])
+
+    assert accepted.empty
+    assert changed.values.tolist() == [['Table_test', 'non_negative', 1, 'Birds', -1]]
+
+
+def test_committed_release_passes_with_known_failures():
+    datas_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Datas')
+
+    failures = check_tables(datas_dir, known_failures=[])
+
+    assert check_tables(datas_dir).empty
+    assert sorted(map(tuple, failures[['table', 'rule', 'row', 'column']].values.tolist())) == \
+        sorted(failure[:4] for failure in KNOWN_FAILURES)
+
+
+def test_refresh_tables_writes_nothing_when_checks_fail(tmp_path):
+    write_table(tmp_path, 'Table_8a_1', pd.DataFrame({
+        'Country': ['Cuba'],
+        'Total endemics (Mammals)': [0],
+        'Threatened endemics (Mammals)': [0],
+        'EX & EW endemics (Mammals)': [5],
+    }))
+    write_table(tmp_path, 'Table_2_Endangered_(EN)', pd.DataFrame({'Year': [2024], 'Birds': [1], 'TOTAL': [1]}))
+    before = (tmp_path / 'Table_8a_1.csv').read_text()
+
+    with pytest.raises(ValueError, match='Checks failed'):
+        refresh_tables(str(tmp_path), check=check_frames)
+
+    assert sorted(os.listdir(tmp_path)) == ['Table_2_Endangered_(EN).csv', 'Table_8a_1.csv']
+    assert (tmp_path / 'Table_8a_1.csv').read_text() == before
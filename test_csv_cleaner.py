@@ -0,0 +1,85 @@
+import os
+
+import pandas as pd
+
+from arrow_store import arrow_path, is_fresh, read_arrow, write_arrow
+from csv_cleaner import clean_tables
+from main import run_pipeline
+
+
+def write_raw_table(work_dir, name, rows):
+    """Writes a raw table the way pdf_table_reader does: header row as data, positional columns."""
+    columns = [str(i) for i in range(len(rows[0]))]
+    write_arrow(pd.DataFrame(rows, columns=columns), arrow_path(work_dir, name))
+
+
+def write_raw_release(work_dir, total_algeria=1):
+    """Writes the raw tables of a small release: one table 8 with a region row and one table 2."""
+    write_raw_table(work_dir, 'Table_8a_1', [
+        [None, 'Mammals', None, None],
+        ['Country', 'Total endemics', 'Threatened endemics', 'EX & EW endemics'],
+        ['North Africa', None, None, None],
+        ['Algeria', str(total_algeria), '0', '0'],
+        ['Egypt', '5', '1', '0'],
+        ['Egypt', '5', '1', '0'],
+    ])
+    write_raw_table(work_dir, 'Table_2_Endangered_(EN)', [
+        ['Year', 'Mammals', 'Birds', 'TOTAL'],
+        ['2024', '1', '2', '3'],
+        ['2023', '2', '2', '4'],
+    ])
+
+
+def test_clean_tables_exports_csv_and_artifact(tmp_path):
+    work_dir, datas_dir = str(tmp_path / 'work'), str(tmp_path / 'Datas')
+    write_raw_release(work_dir)
+
+    clean_tables(work_dir, datas_dir)
+
+    csv_path = os.path.join(datas_dir, 'Table_8a_1.csv')
+    df = pd.read_csv(csv_path)
+    assert df.columns.tolist() == ['Country', 'Total endemics (Mammals)', 'Threatened endemics (Mammals)',
+                                   'EX & EW endemics (Mammals)', 'Region']
+    assert df.values.tolist() == [['Algeria', 1, 0, 0, 'North Africa'],
+                                  ['Egypt', 5, 1, 0, 'North Africa']]
+
+    artifact = arrow_path(datas_dir, 'Table_8a_1')
+    assert is_fresh(artifact, csv_path)
+    pd.testing.assert_frame_equal(read_arrow(artifact), df)
+    assert not [f for f in os.listdir(work_dir) if f.endswith('.csv')]
+
+
+def snapshot(folder):
+    """Files under a folder with their modification times."""
+    return {os.path.relpath(os.path.join(root, f), folder): os.stat(os.path.join(root, f)).st_mtime_ns
+            for root, _, files in os.walk(folder) for f in files}
+
+
+def test_pipelines_stay_in_their_workspaces(tmp_path, monkeypatch):
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    pdf_dir = tmp_path / 'pdfs'
+    pdf_dir.mkdir()
+
+    releases = {'a': 1, 'b': 7}
+    for release, total_algeria in releases.items():
+        write_raw_release(str(tmp_path / release / 'work'), total_algeria=total_algeria)
+
+    before_b = snapshot(tmp_path / 'b')
+    run_pipeline(str(pdf_dir), str(tmp_path / 'a' / 'work'), str(tmp_path / 'a' / 'Datas'))
+    assert snapshot(tmp_path / 'b') == before_b
+
+    before_a = snapshot(tmp_path / 'a')
+    run_pipeline(str(pdf_dir), str(tmp_path / 'b' / 'work'), str(tmp_path / 'b' / 'Datas'))
+    assert snapshot(tmp_path / 'a') == before_a
+
+    assert os.listdir(cwd) == []
+    assert os.listdir(pdf_dir) == []
+    for release, total_algeria in releases.items():
+        datas_dir = tmp_path / release / 'Datas'
+        assert sorted(f for f in os.listdir(datas_dir) if f.endswith('.csv')) == \
+            ['Table_2_Endangered_(EN).csv', 'Table_8a_1.csv', 'Table_time.csv']
+        df = pd.read_csv(datas_dir / 'Table_8a_1.csv')
+        assert df['Total endemics (Mammals)'].tolist() == [total_algeria, 5]
+        assert df['LC endemics (Mammals)'].tolist() == [total_algeria, 4]